@@ -43,7 +43,10 @@ def load_approaches(cad_json_path):
         cad_json = json.load(f)
         cad_fields = cad_json['fields']
         cad_data = cad_json['data']
+        # Pick out the positions of the fields a `CloseApproach` needs.
+        des, cd, dist, v_rel = (cad_fields.index(field)
+                                for field in ('des', 'cd', 'dist', 'v_rel'))
         for cad_datum in cad_data:
-            cad_dict = dict(zip(cad_fields, cad_datum))
-            approaches.append(CloseApproach(**cad_dict))
+            approaches.append(CloseApproach.from_row(
+                cad_datum[des], cad_datum[cd], cad_datum[dist], cad_datum[v_rel]))
     return tuple(approaches)
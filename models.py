@@ -17,9 +17,41 @@ quirks of the data set, such as missing names and unknown diameters.
 
 You'll edit this file in Task 1.
 """
+from functools import lru_cache
+
 from helpers import cd_to_datetime, datetime_to_str
 
 
+# Templates for the `__str__` and `__repr__` of the models.
+_NEO_STR = ("NEO {fullname} has a diameter of {diameter:.3f} km "
+            "and {hazardous} potentially hazardous.")
+_NEO_REPR = ("NearEarthObject(designation={designation!r}, name={name!r}, "
+             "diameter={diameter:.3f}, hazardous={hazardous!r})")
+_CA_STR = ("At {time}, '{fullname}' approaches Earth at a distance of {distance:.2f} au "
+           "and a velocity of {velocity:.2f} km/s.")
+_CA_REPR = ("CloseApproach(time={time!r}, distance={distance:.2f}, "
+            "velocity={velocity:.2f}, neo={neo!r})")
+
+# The shared sentinel for an unknown diameter.
+_NAN = float('nan')
+
+
+@lru_cache(maxsize=65536)
+def _cached_cd(calendar_date):
+    """Return `cd_to_datetime(calendar_date)`, reusing the result for repeated dates.
+
+    Many approaches share a `cd` value, and `datetime`s are immutable, so the
+    parsed objects can safely be shared between approaches.
+    """
+    return cd_to_datetime(calendar_date)
+
+
+@lru_cache(maxsize=65536)
+def _fmt_dt(dt):
+    """Return `datetime_to_str(dt)`, reusing the result for repeated datetimes."""
+    return datetime_to_str(dt)
+
+
 class NearEarthObject:
     """A near-Earth object (NEO).
 
@@ -32,69 +64,66 @@ class NearEarthObject:
     initialized to an empty collection, but eventually populated in the
     `NEODatabase` constructor.
     """
+    __slots__ = ('designation', '_name', 'diameter', 'hazardous', 'approaches', '_fullname')
+
     def __init__(self, **info):
         """Create a new `NearEarthObject`.
 
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
-        if 'pdes' in info and info['pdes']:
-            self.designation = info['pdes']
-        else:
+        self.designation = info.get('pdes')
+        if not self.designation:
             raise KeyError('The unique primary designation (pdes) for NEO is missing.')
-        if 'name' in info and info['name']:
-            self.name = info['name']
-        else:
-            self.name = None
-        if 'diameter' in info and info['diameter']:
-            self.diameter = float(info['diameter'])
-        else:
-            self.diameter = float('nan')
-        if 'pha' in info and info['pha']:
-            if info['pha'] == 'Y':
-                hazardous_mark = True
-            else:
-                hazardous_mark = False
-            self.hazardous = hazardous_mark
-        else:
-            self.hazardous = False
+        self.name = info.get('name') or None
+        self.diameter = float(info['diameter']) if info.get('diameter') else _NAN
+        self.hazardous = info.get('pha') == 'Y'
 
         # Create an empty initial collection of linked approaches.
         self.approaches = []
 
+    @property
+    def name(self):
+        """Return the IAU name of this NEO, or `None` if it has none."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """Set the IAU name of this NEO, discarding the cached full name."""
+        self._name = value
+        self._fullname = None
+
     @property
     def fullname(self):
-        """Return a representation of the full name of this NEO."""
-        if self.name:
-            return (f"{self.designation} ({self.name})")
-        else:
-            return (f"{self.designation}")
+        """Return a representation of the full name of this NEO.
+
+        The full name is computed on first use and cached on the instance until
+        the name changes. The designation is the NEO's primary key (the
+        `NEODatabase` indexes NEOs by it), so it must not change after
+        construction.
+        """
+        if self._fullname is None:
+            if self.name:
+                self._fullname = f"{self.designation} ({self.name})"
+            else:
+                self._fullname = f"{self.designation}"
+        return self._fullname
 
     def __str__(self):
         """Return `str(self)`."""
-        if self.hazardous:
-            hazardous_string = "is"
-        else:
-            hazardous_string = "is not"
-        return (f"NEO {self.fullname} " +
-                f"has a diameter of {self.diameter:.3f} km " +
-                f"and {hazardous_string} potentially hazardous.")
+        return _NEO_STR.format(fullname=self.fullname, diameter=self.diameter,
+                               hazardous='is' if self.hazardous else 'is not')
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
-        return (f"NearEarthObject(designation={self.designation!r}, name={self.name!r}, "
-                f"diameter={self.diameter:.3f}, hazardous={self.hazardous!r})")
+        return _NEO_REPR.format(designation=self.designation, name=self.name,
+                                diameter=self.diameter, hazardous=self.hazardous)
 
     def serialize(self):
         """Return serialized attributes for writing to file."""
-        serialized = {}
-        serialized['designation'] = self.designation
-        if self.name:
-            serialized['name'] = self.name
-        else:
-            serialized['name'] = ''
-        serialized['diameter_km'] = self.diameter
-        serialized['potentially_hazardous'] = self.hazardous
-        return serialized
+        return {'designation': self.designation,
+                'name': self.name or '',
+                'diameter_km': self.diameter,
+                'potentially_hazardous': self.hazardous}
 
 
 class CloseApproach:
@@ -110,32 +139,92 @@ class CloseApproach:
     private attribute, but the referenced NEO is eventually replaced in the
     `NEODatabase` constructor.
     """
+    __slots__ = ('_designation', '_cd', '_time', '_distance', '_velocity', 'neo', '_time_str',
+                 '_raw_dist', '_raw_vel')
+
     def __init__(self, **info):
         """Create a new `CloseApproach`.
 
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
+        self._setup(info.get('des'), info.get('cd'), info.get('dist'), info.get('v_rel'))
+
+    @classmethod
+    def from_row(cls, des, cd, dist, v_rel):
+        """Create a new `CloseApproach` from positional field values.
+
+        This is equivalent to `CloseApproach(des=des, cd=cd, dist=dist, v_rel=v_rel)`,
+        but skips building and probing a keyword argument dictionary.
+
+        :param des: The primary designation of the approaching NEO.
+        :param cd: The approach time, in NASA's calendar date format.
+        :param dist: The nominal approach distance, in astronomical units.
+        :param v_rel: The relative approach velocity, in kilometers per second.
+        :return: A new `CloseApproach`.
+        """
+        self = cls.__new__(cls)
+        self._setup(des, cd, dist, v_rel)
+        return self
+
+    def _setup(self, des, cd, dist, v_rel):
+        """Initialize this `CloseApproach` from its raw field values."""
         # Assign information from the arguments passed to the constructor
         # onto attributes named `_designation`, `time`, `distance`, and `velocity`.
-        if 'des' in info and info['des']:
-            self._designation = info['des']
-        else:
+        if not des:
             raise KeyError('The unique designation for CA is missing.')
-        if 'cd' in info and info['cd']:
-            self.time = cd_to_datetime(info['cd'])
-        else:
-            self.time = None
-        if 'dist' in info and info['dist']:
-            self.distance = float(info['dist'])
-        else:
-            self.distance = 0.0
-        if 'v_rel' in info and info['v_rel']:
-            self.velocity = float(info['v_rel'])
-        else:
-            self.velocity = 0.0
+        self._designation = des
+        # The raw calendar date is only parsed when `time` is first accessed.
+        self._cd = cd
+        self._time = None
+        self._distance = float(dist) if dist else 0.0
+        self._velocity = float(v_rel) if v_rel else 0.0
+        # Keep the source values, so they can be written back out unchanged.
+        # This trades two string references per approach for skipping the
+        # float formatting when writing CSV. Assigning `distance` or `velocity`
+        # discards the corresponding source value.
+        self._raw_dist = dist
+        self._raw_vel = v_rel
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = None
+        # The formatted approach time is computed on first use.
+        self._time_str = None
+
+    @property
+    def time(self):
+        """Return the approach time as a naive `datetime`, or `None` if unknown."""
+        if self._time is None and self._cd:
+            self._time = _cached_cd(self._cd)
+        return self._time
+
+    @time.setter
+    def time(self, value):
+        """Set the approach time, replacing any raw calendar date and formatted time."""
+        self._cd = None
+        self._time = value
+        self._time_str = None
+
+    @property
+    def distance(self):
+        """Return the nominal approach distance, in astronomical units."""
+        return self._distance
+
+    @distance.setter
+    def distance(self, value):
+        """Set the approach distance, discarding the source distance string."""
+        self._distance = value
+        self._raw_dist = None
+
+    @property
+    def velocity(self):
+        """Return the relative approach velocity, in kilometers per second."""
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value):
+        """Set the approach velocity, discarding the source velocity string."""
+        self._velocity = value
+        self._raw_vel = None
 
     @property
     def time_str(self):
@@ -149,25 +238,25 @@ class CloseApproach:
         The `datetime_to_str` method converts a `datetime` object to a
         formatted string that can be used in human-readable representations and
         in serialization to CSV and JSON files.
+
+        The formatted string is computed once and cached on the instance.
         """
-        return datetime_to_str(self.time)
+        if self._time_str is None:
+            self._time_str = _fmt_dt(self.time)
+        return self._time_str
 
     def __str__(self):
         """Return `str(self)`."""
-        return (f"At {self.time_str}, " +
-                f"'{self.neo.fullname}' approaches Earth " +
-                f"at a distance of {self.distance:.2f} au " +
-                f"and a velocity of {self.velocity:.2f} km/s.")
+        return _CA_STR.format(time=self.time_str, fullname=self.neo.fullname,
+                              distance=self.distance, velocity=self.velocity)
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
-        return (f"CloseApproach(time={self.time_str!r}, distance={self.distance:.2f}, "
-                f"velocity={self.velocity:.2f}, neo={self.neo!r})")
+        return _CA_REPR.format(time=self.time_str, distance=self.distance,
+                               velocity=self.velocity, neo=self.neo)
 
     def serialize(self):
         """Return serialized attributes for writing to file."""
-        serialized = {}
-        serialized['datetime_utc'] = self.time_str
-        serialized['distance_au'] = self.distance
-        serialized['velocity_km_s'] = self.velocity
-        return serialized
+        return {'datetime_utc': self.time_str,
+                'distance_au': self.distance,
+                'velocity_km_s': self.velocity}
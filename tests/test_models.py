@@ -0,0 +1,70 @@
+"""Check the behavior of the `NearEarthObject` and `CloseApproach` models.
+
+The models cache some derived values, such as an NEO's full name and a close
+approach's parsed and formatted time, and `CloseApproach` can also be built
+from positional row values. These tests check that those paths agree with the
+keyword constructors and stay in sync when attributes change.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_models
+"""
+import datetime
+import unittest
+
+from models import NearEarthObject, CloseApproach
+
+
+class TestNearEarthObjectFullname(unittest.TestCase):
+    def test_fullname_follows_name_changes(self):
+        neo = NearEarthObject(pdes='433')
+        self.assertEqual(neo.fullname, '433')
+        neo.name = 'Eros'
+        self.assertEqual(neo.fullname, '433 (Eros)')
+
+
+class TestCloseApproachFromRow(unittest.TestCase):
+    ATTRIBUTES = ('_designation', 'time', 'distance', 'velocity', 'neo')
+
+    def assertSameApproach(self, des, cd, dist, v_rel):
+        from_row = CloseApproach.from_row(des, cd, dist, v_rel)
+        from_kwargs = CloseApproach(des=des, cd=cd, dist=dist, v_rel=v_rel)
+        for attribute in self.ATTRIBUTES:
+            self.assertEqual(getattr(from_row, attribute), getattr(from_kwargs, attribute))
+
+    def test_from_row_matches_constructor(self):
+        self.assertSameApproach('2020 AY1', '2020-Jan-01 00:54',
+                                '0.0211660525256395', '5.62203195551878')
+
+    def test_from_row_matches_constructor_with_missing_values(self):
+        self.assertSameApproach('2020 AY1', '', '', '')
+        self.assertSameApproach('2020 AY1', None, None, None)
+
+    def test_from_row_requires_designation(self):
+        with self.assertRaises(KeyError):
+            CloseApproach.from_row('', '2020-Jan-01 00:54', '0.02', '5.6')
+        with self.assertRaises(KeyError):
+            CloseApproach(cd='2020-Jan-01 00:54', dist='0.02', v_rel='5.6')
+
+
+class TestCloseApproachTime(unittest.TestCase):
+    def test_time_is_parsed_lazily(self):
+        approach = CloseApproach(des='2020 AY1', cd='2020-Jan-01 00:54')
+        self.assertIsNone(approach._time)
+        self.assertEqual(approach.time, datetime.datetime(2020, 1, 1, 0, 54))
+
+    def test_repeated_dates_share_a_datetime(self):
+        first = CloseApproach(des='2020 AY1', cd='2020-Jan-01 00:54')
+        second = CloseApproach.from_row('2019 YK', '2020-Jan-01 00:54', '0.03', '7.3')
+        self.assertIs(first.time, second.time)
+
+    def test_time_can_be_assigned(self):
+        approach = CloseApproach(des='2020 AY1', cd='2020-Jan-01 00:54')
+        self.assertEqual(approach.time_str, '2020-01-01 00:54')
+        approach.time = datetime.datetime(2021, 2, 3, 4, 5)
+        self.assertEqual(approach.time, datetime.datetime(2021, 2, 3, 4, 5))
+        self.assertEqual(approach.time_str, '2021-02-03 04:05')
+
+
+if __name__ == '__main__':
+    unittest.main()
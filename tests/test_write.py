@@ -20,6 +20,7 @@ import csv
 import datetime
 import io
 import json
+import math
 import pathlib
 import unittest
 import unittest.mock
@@ -27,6 +28,7 @@ import unittest.mock
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
+from models import NearEarthObject, CloseApproach
 from write import write_to_csv, write_to_json
 
 
@@ -103,6 +105,10 @@ class TestWriteToCSV(unittest.TestCase):
             raise self.failureException("Unable to sniff for headers.") from err
 
 
+    def test_csv_data_uses_newline_line_endings(self):
+        self.assertNotIn('\r', self.value)
+        self.assertTrue(self.value.endswith('\n'))
+
     def test_csv_data_has_five_rows(self):
         # Now, we have the value in memory, and can _actually_ start testing.
         buf = io.StringIO(self.value)
@@ -131,6 +137,91 @@ class TestWriteToCSV(unittest.TestCase):
         self.assertGreater(len(rows), 0)
         self.assertSetEqual(set(fieldnames), set(rows[0].keys()))
 
+    @unittest.mock.patch('write.open')
+    def test_csv_data_quotes_names_with_commas(self, mock_file):
+        neo = NearEarthObject(pdes='433', name='Eros, the Lover', diameter='16.84', pha='N')
+        approach = CloseApproach(des='433', cd='2020-Jan-01 00:00', dist='0.15', v_rel='5.5')
+        approach.neo = neo
+
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_csv((approach,), None)
+            buf.seek(0)
+            rows = tuple(csv.DictReader(buf))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['name'], 'Eros, the Lover')
+        self.assertEqual(rows[0]['diameter_km'], '16.84')
+
+    @unittest.mock.patch('write.open')
+    def test_csv_data_blanks_unknown_diameter(self, mock_file):
+        neo = NearEarthObject(pdes='2020 AY1', pha='N')
+        approach = CloseApproach(des='2020 AY1', cd='2020-Jan-01 00:54', dist='0.02', v_rel='5.6')
+        approach.neo = neo
+
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_csv((approach,), None)
+            buf.seek(0)
+            rows = tuple(csv.DictReader(buf))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['diameter_km'], '')
+
+    @unittest.mock.patch('write.open')
+    def test_csv_data_blanks_zero_distance_and_velocity(self, mock_file):
+        neo = NearEarthObject(pdes='433', name='Eros', diameter='16.84', pha='N')
+        approaches = (CloseApproach(des='433', cd='2020-Jan-01 00:00', dist='0', v_rel='0.0'),
+                      CloseApproach(des='433', cd='2020-Jan-01 00:00', dist=0.0, v_rel=0.0))
+        for approach in approaches:
+            approach.neo = neo
+
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_csv(approaches, None)
+            buf.seek(0)
+            rows = tuple(csv.DictReader(buf))
+
+        for row in rows:
+            self.assertEqual(row['distance_au'], '')
+            self.assertEqual(row['velocity_km_s'], '')
+
+    @unittest.mock.patch('write.open')
+    def test_csv_data_follows_reassigned_distance_and_velocity(self, mock_file):
+        neo = NearEarthObject(pdes='433', name='Eros', diameter='16.84', pha='N')
+        approaches = (CloseApproach(des='433', cd='2020-Jan-01 00:00', dist='0.5', v_rel='5.5'),
+                      CloseApproach(des='433', cd='2020-Jan-01 00:00', dist='', v_rel=''))
+        for approach in approaches:
+            approach.neo = neo
+            approach.distance = 0.25
+            approach.velocity = 7.5
+
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_csv(approaches, None)
+            buf.seek(0)
+            rows = tuple(csv.DictReader(buf))
+
+        for row in rows:
+            self.assertEqual(row['distance_au'], '0.25')
+            self.assertEqual(row['velocity_km_s'], '7.5')
+
+    @unittest.mock.patch('write._CSV_CHUNK_ROWS', 2)
+    @unittest.mock.patch('write.open')
+    def test_csv_data_spanning_several_chunks_is_complete_and_ordered(self, mock_file):
+        results = build_results(7)
+
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_csv(results, None)
+            buf.seek(0)
+            rows = tuple(csv.DictReader(buf))
+
+        self.assertEqual([row['designation'] for row in rows],
+                         [approach._designation for approach in results])
+        self.assertEqual([row['datetime_utc'] for row in rows],
+                         [approach.time_str for approach in results])
+
 
 class TestWriteToJSON(unittest.TestCase):
     @classmethod
@@ -225,6 +316,53 @@ class TestWriteToJSON(unittest.TestCase):
         self.assertIsInstance(approach['neo']['diameter_km'], float)
         self.assertIsInstance(approach['neo']['potentially_hazardous'], bool)
 
+    @unittest.mock.patch('write.open')
+    def write_json(self, results, mock_file):
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_to_json(results, None)
+            buf.seek(0)
+            return json.load(buf)
+
+    def test_json_data_is_empty_list_without_results(self):
+        self.assertEqual(self.write_json(()), [])
+
+    def test_json_data_has_single_element(self):
+        data = self.write_json(build_results(1))
+        self.assertEqual(len(data), 1)
+        self.assertIsInstance(data[0], collections.abc.Mapping)
+
+    def test_json_data_keeps_unknown_diameter_as_nan(self):
+        neo = NearEarthObject(pdes='2020 AY1', pha='N')
+        approach = CloseApproach(des='2020 AY1', cd='2020-Jan-01 00:54', dist='0.02', v_rel='5.6')
+        approach.neo = neo
+
+        with unittest.mock.patch('write.open') as mock_file:
+            with UncloseableStringIO() as buf:
+                mock_file.return_value = buf
+                write_to_json((approach,), None)
+                buf.seek(0)
+                value = buf.getvalue()
+
+        self.assertIn('"diameter_km": NaN', value)
+        self.assertTrue(math.isnan(json.loads(value)[0]['neo']['diameter_km']))
+
+    def test_json_data_repeats_shared_neo(self):
+        neo = NearEarthObject(pdes='433', name='Eros', diameter='16.84', pha='Y')
+        approaches = (CloseApproach(des='433', cd='2020-Jan-01 00:00', dist='0.15', v_rel='5.5'),
+                      CloseApproach(des='433', cd='2020-Feb-01 00:00', dist='0.25', v_rel='6.5'))
+        for approach in approaches:
+            approach.neo = neo
+
+        data = self.write_json(approaches)
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual([approach['distance_au'] for approach in data], [0.15, 0.25])
+        for approach in data:
+            self.assertEqual(approach['neo'], {'designation': '433', 'name': 'Eros',
+                                               'diameter_km': 16.84,
+                                               'potentially_hazardous': True})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -11,7 +11,71 @@ extension determines which of these functions is used.
 You'll edit this file in Part 4.
 """
 import csv
+import io
 import json
+from itertools import islice
+from operator import attrgetter
+
+from models import NearEarthObject, CloseApproach
+
+
+# The number of CSV rows formatted in memory between writes to the file.
+_CSV_CHUNK_ROWS = 1 << 14
+
+# Fetch the attributes written for each approach and its NEO in single C-level
+# calls. JSON output uses `_approach_attrs`; CSV output uses
+# `_csv_approach_attrs`, which also fetches the source distance and velocity
+# strings, and `_neo_attrs`.
+_approach_attrs = attrgetter('time_str', 'distance', 'velocity', 'neo')
+_csv_approach_attrs = attrgetter('time_str', 'distance', 'velocity',
+                                 '_raw_dist', '_raw_vel', 'neo')
+_neo_attrs = attrgetter('designation', 'name', 'diameter', 'hazardous')
+
+
+class NEOEncoder(json.JSONEncoder):
+    """A JSON encoder that understands `CloseApproach` and `NearEarthObject`.
+
+    The encoder is handed the model objects directly, so no intermediate list
+    of dictionaries has to be built before encoding.
+
+    Many close approaches share an NEO, so each NEO's dictionary is built once
+    per encoder and reused for all of its approaches.
+    """
+    def __init__(self, **kwargs):
+        """Create a new `NEOEncoder`, accepting the `json.JSONEncoder` options."""
+        super().__init__(**kwargs)
+        self._neo_cache = {}
+
+    def default(self, obj):
+        """Return a serializable version of `obj`."""
+        if isinstance(obj, CloseApproach):
+            time_str, distance, velocity, neo = _approach_attrs(obj)
+            serialized_neo = self._neo_cache.get(neo)
+            if serialized_neo is None:
+                serialized_neo = self._neo_cache[neo] = neo.serialize()
+            return {'datetime_utc': time_str,
+                    'distance_au': distance,
+                    'velocity_km_s': velocity,
+                    'neo': serialized_neo}
+        if isinstance(obj, NearEarthObject):
+            return obj.serialize()
+        return super().default(obj)
+
+
+def _rows(results):
+    """Generate the CSV row for each `CloseApproach`, blanking missing values."""
+    neo_attrs = _neo_attrs
+    for (time_str, distance, velocity,
+         raw_dist, raw_vel, neo) in map(_csv_approach_attrs, results):
+        designation, name, diameter, hazardous = neo_attrs(neo)
+        # Zero distances and velocities are blanked based on the parsed values,
+        # but nonzero ones are written as their source strings, if still kept.
+        # `csv.writer` formats the floats and booleans itself, in C. An unknown
+        # diameter is NaN, which is the only value not equal to itself.
+        yield (time_str, (raw_dist or distance) if distance else '',
+               (raw_vel or velocity) if velocity else '',
+               designation, name or '',
+               diameter if diameter == diameter else '', hazardous)
 
 
 def write_to_csv(results, filename):
@@ -25,37 +89,26 @@ def write_to_csv(results, filename):
     :param filename: A Path-like object pointing to where the data should be saved.
     """
     field_names = ('datetime_utc', 'distance_au', 'velocity_km_s',
-                  'designation', 'name', 'diameter_km',
-                  'potentially_hazardous')
-
-    with open(filename, 'w') as f:
-        # Write header
-        f.writelines(','.join(field_names) + '\n')
-        # Write results
-        for result in results:
-            if result.distance:
-                distance = str(result.distance)
-            else:
-                distance = ''
-            if result.velocity:
-                velocity = str(result.velocity)
-            else:
-                velocity = ''
-            if result.neo.name:
-                name = result.neo.name
-            else:
-                name = ''
-            if result.neo.diameter:
-                diameter = str(result.neo.diameter)
-            else:
-                diameter = ''
-            if result.neo.hazardous:
-                hazardous = 'True'
-            else:
-                hazardous = 'False'
-            result_str = (result.time_str, distance, velocity, result._designation,
-                          name, diameter, hazardous)
-            f.writelines(','.join(result_str) + '\n')
+                   'designation', 'name', 'diameter_km',
+                   'potentially_hazardous')
+
+    # Rows are formatted into an in-memory buffer, which is written to the
+    # file once per `_CSV_CHUNK_ROWS` rows.
+    buf = io.StringIO()
+    writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+    writer.writerow(field_names)
+
+    results = iter(results)
+    with open(filename, 'w', newline='', buffering=1 << 20) as f:
+        write = f.write
+        while True:
+            writer.writerows(_rows(islice(results, _CSV_CHUNK_ROWS)))
+            chunk = buf.getvalue()
+            if not chunk:
+                break
+            write(chunk)
+            buf.seek(0)
+            buf.truncate()
 
 
 def write_to_json(results, filename):
@@ -69,13 +122,16 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    results_json = []
-
-    for result in results:
-        neo_serialized = result.neo.serialize()
-        result_serialized = result.serialize()
-        result_serialized['neo'] = neo_serialized
-        results_json.append(result_serialized)
+    # The output is tree-shaped, so skip the circular reference bookkeeping.
+    encode = NEOEncoder(check_circular=False, ensure_ascii=False).encode
 
-    with open(filename, 'w') as f:
-        json.dump(results_json, f)
+    # Encode and write one approach at a time, rather than holding the whole
+    # document in memory.
+    with open(filename, 'w', encoding='utf-8') as f:
+        write = f.write
+        write('[')
+        for i, result in enumerate(results):
+            if i:
+                write(', ')
+            write(encode(result))
+        write(']')